@@ -0,0 +1 @@
+"""Standalone micro-benchmarks. Run from the backend/ directory with `python -m benchmarks.<name>`."""
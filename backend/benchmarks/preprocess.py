@@ -0,0 +1,80 @@
+"""
+Throughput benchmark for the article preprocessor.
+
+Builds synthetic pages shaped like what the extension sends (nav menus,
+cookie banners, repeated share widgets, a comment section) and reports
+preprocessing throughput and bytes saved for increasing page sizes.
+
+Run with: python -m benchmarks.preprocess
+"""
+
+import os
+import random
+import time
+
+# Importing services builds the API client singletons; a placeholder key is
+# enough since the benchmark never calls out.
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from services.preprocessor import article_preprocessor  # noqa: E402
+
+NAV = ["Home", "World", "Politics", "Business", "Tech", "Science", "Sports", "Opinion"]
+BOILERPLATE = [
+    "We use cookies. Accept all",
+    "Subscribe to our newsletter",
+    "Share on Facebook",
+    "Share on X",
+    "Advertisement",
+]
+WORDS = (
+    "the government announced new measures on tuesday according to officials "
+    "who said the policy would take effect next month after a review by experts"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, k=rng.randint(12, 30))
+    return " ".join(words).capitalize() + "."
+
+
+def build_page(target_bytes: int, seed: int = 0) -> str:
+    """Build a synthetic page of roughly `target_bytes` bytes."""
+    rng = random.Random(seed)
+    lines = list(NAV) + BOILERPLATE[:2]
+    size = 0
+    # Article body: ~70% of the page, with share widgets between sections
+    while size < target_bytes * 0.7:
+        paragraph = " ".join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+        lines.append(paragraph)
+        size += len(paragraph) + 1
+        if rng.random() < 0.2:
+            lines.extend(BOILERPLATE[2:])
+    lines.append("Comments")
+    while size < target_bytes:
+        comment = _sentence(rng)
+        lines.extend([f"user{rng.randint(1, 999)}", comment, "Reply"])
+        size += len(comment) + 16
+    return "\n".join(lines)
+
+
+def run(sizes=(10_000, 100_000, 1_000_000, 5_000_000), repeats: int = 5) -> None:
+    print(f"{'page size':>12} {'saved':>8} {'median ms':>10} {'MB/s':>8}")
+    for target in sizes:
+        page = build_page(target)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = article_preprocessor.preprocess(page)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        median = timings[len(timings) // 2]
+        saved = result.bytes_saved / result.original_bytes
+        throughput = result.original_bytes / median / 1_000_000
+        print(
+            f"{result.original_bytes:>12,} {saved:>8.1%} "
+            f"{median * 1000:>10.2f} {throughput:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,86 @@
+"""
+Hit-rate and throughput benchmark for the cache backends across processes.
+
+Simulates N worker processes serving a skewed (Zipf-like) stream of article
+lookups. Every miss pays a fixed "pipeline" cost and then stores the result.
+With the in-memory backend each worker has its own cold cache; with the
+SQLite backend all workers share hits.
+
+Run with: python -m benchmarks.shared_cache [max_workers]
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Importing services builds the API client singletons; a placeholder key is
+# enough since the benchmark never calls out.
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from services.cache import SQLiteCache, TTLCache  # noqa: E402
+
+KEY_SPACE = 5_000
+REQUESTS_PER_WORKER = 4_000
+MISS_COST_SECONDS = 0.002  # Stand-in for the pipeline; real misses cost seconds
+VALUE = {"trust_score": 80, "verdict": "True", "reasoning": "x" * 200}
+
+
+def _keys(seed: int, count: int):
+    """Zipf-like key stream: a few popular articles, a long tail."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(KEY_SPACE)]
+    return rng.choices(range(KEY_SPACE), weights=weights, k=count)
+
+
+def _worker(args):
+    backend, path, seed, start_at = args
+    if backend == "sqlite":
+        cache = SQLiteCache(path, "bench", ttl=3600, max_entries=KEY_SPACE * 2)
+    else:
+        cache = TTLCache(ttl=3600, max_entries=KEY_SPACE * 2)
+
+    keys = _keys(seed, REQUESTS_PER_WORKER)
+    # Start together so workers genuinely contend
+    time.sleep(max(0.0, start_at - time.time()))
+
+    hits = 0
+    started = time.perf_counter()
+    for key in keys:
+        cache_key = f"article:{key}"
+        if cache.get(cache_key) is not None:
+            hits += 1
+        else:
+            time.sleep(MISS_COST_SECONDS)
+            cache.set(cache_key, VALUE)
+    return hits, time.perf_counter() - started
+
+
+def run_once(backend: str, workers: int) -> tuple:
+    """Run one configuration; returns (hit rate, requests per second)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite3")
+        start_at = time.time() + 0.5
+        jobs = [(backend, path, seed, start_at) for seed in range(workers)]
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            results = pool.map(_worker, jobs)
+
+    total_hits = sum(hits for hits, _ in results)
+    wall = max(elapsed for _, elapsed in results)
+    total = workers * REQUESTS_PER_WORKER
+    return total_hits / total, total / wall
+
+
+def run(max_workers: int) -> None:
+    counts = sorted({1, 2, 4, max_workers} & set(range(1, max_workers + 1)))
+    print(f"{'backend':>8} {'workers':>8} {'hit rate':>9} {'req/s':>10}")
+    for backend in ("memory", "sqlite"):
+        for workers in counts:
+            hit_rate, throughput = run_once(backend, workers)
+            print(f"{backend:>8} {workers:>8} {hit_rate:>9.1%} {throughput:>10,.0f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1)
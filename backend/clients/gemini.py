@@ -4,28 +4,41 @@ Updated for Google Gen AI SDK (v1.0+).
 """
 
 import os
+from typing import Optional
 from google import genai
 from google.genai import types
 from config import settings
+from logging_config import get_logger
+from usage import record_usage
+
+logger = get_logger(__name__)
 
 
 class GeminiClient:
     """Client for interacting with Google's Gemini API."""
 
+    # Returned instead of raising when generation fails
+    ERROR_RESPONSE = "Error: Unable to generate response."
+
     def __init__(self):
         """Initialize the Gemini client with API key from settings."""
         # Initialize the new Client
         self.client = genai.Client(api_key=settings.gemini_api_key)
         self.model = settings.gemini_model
 
-    def generate(self, prompt: str) -> str:
+    def generate(self, prompt: str, model: Optional[str] = None) -> str:
         """
         Generate content using Gemini.
+
+        Args:
+            prompt: The prompt to send.
+            model: Model to use instead of the configured default.
         """
+        record_usage(gemini_calls=1)
         try:
             # New SDK call format
             response = self.client.models.generate_content(
-                model=self.model,
+                model=model or self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=0.0,  # Keep it deterministic
@@ -47,11 +60,19 @@ class GeminiClient:
                     ],
                 ),
             )
+            metadata = response.usage_metadata
+            if metadata is not None:
+                record_usage(
+                    prompt_tokens=metadata.prompt_token_count or 0,
+                    cached_prompt_tokens=metadata.cached_content_token_count or 0,
+                    output_tokens=metadata.candidates_token_count or 0,
+                    thinking_tokens=metadata.thoughts_token_count or 0,
+                )
             return response.text.strip()
         except Exception as e:
-            print(f"🔥 GEMINI ERROR: {e}")
+            logger.error("Gemini generation failed: %s", e)
             # Return a safe fallback so the server doesn't 500 crash
-            return "Error: Unable to generate response."
+            return self.ERROR_RESPONSE
 
 
 # Singleton instance for reuse
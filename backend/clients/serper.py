@@ -5,6 +5,10 @@ Serper API client for Google Search.
 from typing import List
 import requests
 from config import settings
+from logging_config import get_logger
+from usage import record_usage
+
+logger = get_logger(__name__)
 
 
 class SerperClient:
@@ -39,6 +43,7 @@ class SerperClient:
             "num": num_results,
         }
 
+        record_usage(serper_calls=1)
         try:
             response = requests.post(
                 self.endpoint,
@@ -64,10 +69,10 @@ class SerperClient:
             return results
 
         except requests.RequestException as e:
-            print(f"Error searching Google: {e}")
+            logger.warning("Error searching Google: %s", e)
             return []
         except Exception as e:
-            print(f"Unexpected error in Serper search: {e}")
+            logger.exception("Unexpected error in Serper search")
             return []
 
 
@@ -7,6 +7,10 @@ import json
 import requests
 from typing import Optional
 from config import settings
+from logging_config import get_logger
+from usage import record_usage
+
+logger = get_logger(__name__)
 
 
 class YellowcakeClient:
@@ -33,6 +37,7 @@ class YellowcakeClient:
             "prompt": "Extract the main article content, ignoring navigation and footers.",
         }
 
+        record_usage(yellowcake_calls=1)
         try:
             # We use stream=True to handle the SSE response
             response = requests.post(
@@ -70,13 +75,15 @@ class YellowcakeClient:
                         except json.JSONDecodeError:
                             continue
 
+            if final_data:
+                record_usage(scraped_bytes=len(final_data.encode("utf-8")))
             return final_data
 
         except requests.RequestException as e:
-            print(f"Error scraping {url}: {e}")
+            logger.warning("Error scraping %s: %s", url, e)
             return None
         except Exception as e:
-            print(f"Unexpected error scraping {url}: {e}")
+            logger.exception("Unexpected error scraping %s", url)
             return None
 
 
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     # App Settings
     app_name: str = "Agentic Fake News Detector"
     debug: bool = False
+    workers: int = 1  # uvicorn worker processes; >1 needs a shared cache backend
 
     # External APIs
     serper_endpoint: str = "https://google.serper.dev/search"
@@ -31,6 +32,31 @@ class Settings(BaseSettings):
 
     gemini_model: str = "gemini-3-flash-preview"
 
+    # Cache Settings
+    cache_backend: str = "auto"  # "memory", "sqlite", or "auto" (sqlite when workers > 1)
+    cache_path: str = os.path.join(backend_dir, "cache.sqlite3")
+    verdict_cache_ttl: int = 6 * 60 * 60  # 6 hours
+    search_cache_ttl: int = 60 * 60  # 1 hour
+    scrape_cache_ttl: int = 60 * 60  # 1 hour
+    cache_max_entries: int = 10000
+    checkpoint_ttl: int = 10 * 60  # Stage outputs kept for retries, 10 minutes
+    stale_verdict_ttl: int = 24 * 60 * 60  # Expired verdicts kept for overload fallback
+
+    # Admission Control (per worker process)
+    rate_limit_per_minute: int = 30  # Per API key / client IP; 0 disables
+    rate_limit_burst: int = 10
+    max_inflight_pipelines: int = 8
+    max_queued_pipelines: int = 16
+    queue_wait_timeout: float = 2.0  # Seconds a queued request waits for a slot
+    overload_retry_after: int = 5  # Retry-After (seconds) when the queue is full
+    serve_stale_on_overload: bool = True
+
+    # Logging Settings
+    log_level: str = "INFO"
+    log_payloads: bool = False  # Prompts contain article text - keep off in production
+    log_payload_sample_rate: float = 0.1
+    log_payload_max_chars: int = 2000
+
     class Config:
         env_file = env_path
         env_file_encoding = "utf-8"
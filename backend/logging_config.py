@@ -0,0 +1,147 @@
+"""
+Structured, non-blocking logging for the API.
+
+Log records are pushed onto an in-memory queue by the request handlers and
+written to stdout by a background listener thread, so a slow terminal or log
+collector never stalls the pipeline. Every record carries the correlation ID
+of the request that produced it.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from config import settings
+
+# Correlation ID of the request currently being handled ("-" outside requests)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+_listener: Optional[QueueListener] = None
+
+_exception_formatter = logging.Formatter()
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request's correlation ID to every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class StructuredQueueHandler(QueueHandler):
+    """
+    Queue handler that keeps exception details separate from the message.
+
+    The stock `QueueHandler.prepare` folds the traceback into the message
+    text; this keeps it in `exc_text` so the JSON output has its own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        # exc_info holds a traceback object, which must not cross threads
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        # Structured fields passed via `extra={"fields": {...}}`, nested so
+        # they can never overwrite the keys above
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry["fields"] = fields
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def setup_logging() -> None:
+    """
+    Configure the application loggers to write through a background queue.
+
+    Safe to call more than once; only the first call installs the handlers.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    # The filter runs in the caller's context, where the request ID is set
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.log_level.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return a module logger."""
+    return logging.getLogger(name)
+
+
+def new_request_id() -> str:
+    """Generate a short correlation ID for a request."""
+    return uuid.uuid4().hex[:16]
+
+
+def log_payload(logger: logging.Logger, label: str, payload: str) -> None:
+    """
+    Log a verbose payload (prompts, model output) at DEBUG level.
+
+    Payloads are only logged when `log_payloads` is enabled, and then only for
+    a `log_payload_sample_rate` fraction of calls, truncated to
+    `log_payload_max_chars`. Prompts embed the article text, so this is off by
+    default.
+
+    Args:
+        logger: The logger to write to.
+        label: Short name for the payload (e.g. "reader.prompt").
+        payload: The text to log.
+    """
+    if not settings.log_payloads or not logger.isEnabledFor(logging.DEBUG):
+        return
+    if random.random() >= settings.log_payload_sample_rate:
+        return
+
+    logger.debug(
+        "payload %s",
+        label,
+        extra={
+            "fields": {
+                "payload_chars": len(payload),
+                "payload": payload[: settings.log_payload_max_chars],
+            }
+        },
+    )
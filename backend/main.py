@@ -7,19 +7,31 @@ A FastAPI application that uses a 3-step agentic pipeline to detect fake news:
 3. Judge - Compares and renders a verdict
 
 Run with: uvicorn main:app --reload
+Or, for multiple workers (WORKERS in .env): python main.py
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
+from logging_config import get_logger, setup_logging, new_request_id, request_id_var
 from routers import verify_router, health_router
+from services.cache import cache_backend
 
 
 def create_app() -> FastAPI:
     """
     Application factory for creating the FastAPI app.
     """
+    setup_logging()
+
+    if settings.workers > 1 and cache_backend() == "memory":
+        get_logger(__name__).warning(
+            "Running %d workers with the in-memory cache; hits are not shared "
+            "between workers. Set CACHE_BACKEND=sqlite.",
+            settings.workers,
+        )
+
     app = FastAPI(
         title=settings.app_name,
         description="An AI-powered fake news detection API using a 3-step agentic pipeline.",
@@ -37,6 +49,18 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def request_id_middleware(request: Request, call_next):
+        """Tag each request with a correlation ID for log tracing."""
+        request_id = request.headers.get("X-Request-ID") or new_request_id()
+        token = request_id_var.set(request_id)
+        try:
+            response = await call_next(request)
+        finally:
+            request_id_var.reset(token)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
     # Include routers
     app.include_router(health_router)
     app.include_router(verify_router)
@@ -51,9 +75,12 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
+    # Reload only supports a single process
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.debug,
+        reload=settings.debug and settings.workers == 1,
+        workers=settings.workers,
+        log_config=None,  # Keep uvicorn on our queue-based handlers
     )
@@ -4,6 +4,8 @@ Health check and status endpoints.
 
 from fastapi import APIRouter
 from config import settings
+from services.cache import cache_backend
+from usage import usage_metrics
 
 router = APIRouter(tags=["health"])
 
@@ -19,7 +21,9 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /verify": "Verify an article for fake news",
+            "GET /verify/lookup": "Look up a cached verdict by content hash",
             "GET /health": "Detailed health check",
+            "GET /metrics": "Token and external call usage totals",
         },
     }
 
@@ -31,9 +35,21 @@ async def health_check():
     """
     return {
         "status": "healthy",
+        "workers": settings.workers,
+        "cache_backend": cache_backend(),
         "services": {
             "gemini": "configured" if settings.gemini_api_key else "not configured",
             "serper": "configured" if settings.serper_api_key else "not configured",
             "yellowcake": "configured" if settings.yellowcake_api_key else "not configured",
         },
     }
+
+
+@router.get("/metrics")
+async def metrics():
+    """
+    Token and external call usage totals per pipeline stage.
+
+    Counts are per worker process since it started.
+    """
+    return usage_metrics.snapshot()
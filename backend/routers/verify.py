@@ -3,15 +3,25 @@ Verification endpoint router.
 Handles the /verify endpoint for fake news detection.
 """
 
-from fastapi import APIRouter, HTTPException
-from schemas.verify import VerifyRequest, VerifyResponse
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from config import settings
+from logging_config import get_logger
+from schemas.verify import VerifyRequest, VerifyResponse, VerifyLookupResponse
+from services.admission import AdmissionRejected, admission_controller
 from services.pipeline import verification_pipeline
 
+logger = get_logger(__name__)
+
 router = APIRouter(prefix="/verify", tags=["verification"])
 
 
 @router.post("", response_model=VerifyResponse)
-async def verify_article(request: VerifyRequest) -> VerifyResponse:
+async def verify_article(
+    request: VerifyRequest,
+    http_request: Request,
+    response: Response,
+) -> VerifyResponse:
     """
     Verify an article for fake news using the 3-step agentic pipeline.
 
@@ -22,6 +32,7 @@ async def verify_article(request: VerifyRequest) -> VerifyResponse:
 
     **Request Body:**
     - `article_text`: The article text to verify (min 10 characters)
+    - `debug`: Include per-stage token and call usage in the response
 
     **Response:**
     - `trust_score`: 0-100 score (0 = fake, 100 = true)
@@ -29,11 +40,80 @@ async def verify_article(request: VerifyRequest) -> VerifyResponse:
     - `reasoning`: Explanation of the verdict
     - `search_query`: The query used for verification
     - `sources_checked`: Number of sources analyzed
+    - `usage`: Per-stage usage (only with `debug`; absent for cached verdicts)
+
+    **Overload:**
+    Requests over the per-client rate get `429`, and requests that cannot get a
+    pipeline slot in time get `503`, both with a `Retry-After` header. On a
+    `503`, a recently expired verdict for the article is returned instead if
+    one is cached, marked with an `X-Verdict-Stale: true` header.
     """
+    client_id = http_request.headers.get("X-API-Key") or (
+        http_request.client.host if http_request.client else "unknown"
+    )
+
     try:
-        return await verification_pipeline.verify(request.article_text)
+        admission_controller.check_rate(client_id)
+
+        # Cached verdicts don't need a pipeline slot. Hashing a large page
+        # is slow, so do it off the event loop.
+        cached = await asyncio.to_thread(
+            verification_pipeline.lookup_article, request.article_text
+        )
+        if cached is not None:
+            return cached
+
+        async with admission_controller.slot():
+            return await verification_pipeline.verify(
+                request.article_text,
+                include_usage=request.debug,
+            )
+    except AdmissionRejected as e:
+        logger.warning("Request rejected (%d): %s", e.status_code, e.detail)
+        # Stale verdicts are for server overload only, not over-rate clients
+        if e.status_code == 503 and settings.serve_stale_on_overload:
+            stale = await asyncio.to_thread(
+                verification_pipeline.lookup_article,
+                request.article_text,
+                allow_stale=True,
+            )
+            if stale is not None:
+                response.headers["X-Verdict-Stale"] = "true"
+                return stale
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=e.detail,
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Verification failed: {str(e)}",
         )
+
+
+@router.get("/lookup", response_model=VerifyLookupResponse)
+async def lookup_verdict(
+    content_hash: str = Query(
+        ...,
+        pattern="^[0-9a-f]{64}$",
+        description="SHA-256 (hex) of the article text, lowercased with whitespace collapsed",
+    ),
+) -> VerifyLookupResponse:
+    """
+    Look up a cached verdict before uploading the article.
+
+    Clients should call this first and only `POST /verify` the full article
+    text when the status is `unknown`.
+
+    **Query Parameters:**
+    - `content_hash`: Hash of the article text
+
+    **Response:**
+    - `status`: "hit" or "unknown"
+    - `result`: The cached verification result on a hit
+    """
+    result = verification_pipeline.lookup(content_hash)
+    if result is None:
+        return VerifyLookupResponse(status="unknown")
+    return VerifyLookupResponse(status="hit", result=result)
@@ -1,5 +1,5 @@
 """Pydantic schemas for request/response models."""
 
-from .verify import VerifyRequest, VerifyResponse
+from .verify import VerifyRequest, VerifyResponse, VerifyLookupResponse, StageUsage
 
-__all__ = ["VerifyRequest", "VerifyResponse"]
+__all__ = ["VerifyRequest", "VerifyResponse", "VerifyLookupResponse", "StageUsage"]
@@ -2,7 +2,7 @@
 Pydantic models for the verification endpoint.
 """
 
-from typing import Optional
+from typing import Dict, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -15,6 +15,24 @@ class VerifyRequest(BaseModel):
         description="The article text to verify for fake news",
         examples=["Scientists discover new species in the Amazon rainforest..."],
     )
+    debug: bool = Field(
+        default=False,
+        description="Include per-stage token and external call usage in the response",
+    )
+
+
+class StageUsage(BaseModel):
+    """Token and external call usage for one pipeline stage."""
+
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Part of prompt_tokens served from context cache
+    output_tokens: int = 0
+    thinking_tokens: int = 0  # Billed as output on top of output_tokens
+    gemini_calls: int = 0
+    serper_calls: int = 0
+    yellowcake_calls: int = 0
+    scraped_bytes: int = 0
+    cache_hits: int = 0
 
 
 class VerifyResponse(BaseModel):
@@ -42,6 +60,23 @@ class VerifyResponse(BaseModel):
         default=None,
         description="Number of sources checked during verification",
     )
+    usage: Optional[Dict[str, StageUsage]] = Field(
+        default=None,
+        description="Per-stage token and external call usage (only when debug is requested)",
+    )
+
+
+class VerifyLookupResponse(BaseModel):
+    """Response model for the cached verdict lookup."""
+
+    status: Literal["hit", "unknown"] = Field(
+        ...,
+        description="'hit' if a verdict is cached, 'unknown' if the article must be uploaded",
+    )
+    result: Optional[VerifyResponse] = Field(
+        default=None,
+        description="The cached verification result on a hit",
+    )
 
 
 class JudgmentResult(BaseModel):
@@ -50,3 +85,20 @@ class JudgmentResult(BaseModel):
     trust_score: int
     verdict: str
     reasoning: str
+    is_fallback: bool = False  # True when the Judge could not reach a verdict
+
+
+class PreprocessedArticle(BaseModel):
+    """Internal model for the article preprocessing step result."""
+
+    text: str
+    canonical_text: str
+    content_hash: str
+    input_hash: str
+    original_bytes: int
+    cleaned_bytes: int
+
+    @property
+    def bytes_saved(self) -> int:
+        """Number of bytes removed from the original article text."""
+        return self.original_bytes - self.cleaned_bytes
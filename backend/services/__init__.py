@@ -1,18 +1,20 @@
 """
 Business logic services for the fake news detection pipeline.
 
-The pipeline consists of three agents:
+Article text is first cleaned by the Preprocessor, then passed through three agents:
 1. Reader - Extracts the core claim from an article
 2. Researcher - Searches and scrapes sources to verify the claim
 3. Judge - Compares the article with sources and renders a verdict
 """
 
+from .preprocessor import ArticlePreprocessor
 from .reader import ReaderService
 from .researcher import ResearcherService
 from .judge import JudgeService
 from .pipeline import VerificationPipeline
 
 __all__ = [
+    "ArticlePreprocessor",
     "ReaderService",
     "ResearcherService",
     "JudgeService",
@@ -0,0 +1,154 @@
+"""
+Admission control for the verification pipeline.
+
+Limits how much pipeline work the server accepts so a traffic spike is shed
+quickly instead of queueing until every request times out:
+- Per-client token buckets (keyed by API key or IP) cap request rates
+- A global in-flight cap with a short, bounded wait queue caps concurrency
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from config import settings
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted to the pipeline."""
+
+    def __init__(self, status_code: int, retry_after: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.detail = detail
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum tokens held (the allowed burst).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """
+    Gatekeeper in front of the verification pipeline.
+
+    State is per worker process, so with multiple workers the effective
+    limits are multiplied by the worker count.
+    """
+
+    # Token buckets kept for at most this many clients (least recent evicted)
+    MAX_TRACKED_CLIENTS = 10000
+
+    def __init__(self):
+        """Initialize limits from settings."""
+        self.rate = settings.rate_limit_per_minute / 60
+        self.burst = settings.rate_limit_burst
+        self.max_queued = settings.max_queued_pipelines
+        self.queue_wait_timeout = settings.queue_wait_timeout
+        self.retry_after = settings.overload_retry_after
+        self._slots = asyncio.Semaphore(settings.max_inflight_pipelines)
+        self._queued = 0
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._buckets_lock = threading.Lock()
+
+    def check_rate(self, client_id: str) -> None:
+        """
+        Charge one request to a client's token bucket.
+
+        Args:
+            client_id: API key or IP address identifying the client.
+
+        Raises:
+            AdmissionRejected: With status 429 if the client is over its rate.
+        """
+        if self.rate <= 0:
+            return
+
+        with self._buckets_lock:
+            bucket = self._buckets.get(client_id)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[client_id] = bucket
+                if len(self._buckets) > self.MAX_TRACKED_CLIENTS:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client_id)
+            wait = bucket.take()
+
+        if wait > 0:
+            raise AdmissionRejected(
+                status_code=429,
+                retry_after=math.ceil(wait),
+                detail="Rate limit exceeded. Please retry later.",
+            )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one of the in-flight pipeline slots for the duration of the block.
+
+        Waits up to `queue_wait_timeout` seconds for a slot if all are busy.
+
+        Raises:
+            AdmissionRejected: With status 503 if the wait queue is full or
+                no slot frees up in time.
+        """
+        if not self._slots.locked():
+            # A free slot is taken without suspending, so it never counts as queued
+            await self._slots.acquire()
+        elif self._queued >= self.max_queued:
+            raise self._overloaded()
+        else:
+            self._queued += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_wait_timeout)
+            except asyncio.TimeoutError:
+                raise self._overloaded()
+            finally:
+                self._queued -= 1
+
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def _overloaded(self) -> AdmissionRejected:
+        """Build the rejection returned when the server is at capacity."""
+        return AdmissionRejected(
+            status_code=503,
+            retry_after=self.retry_after,
+            detail="Server is overloaded. Please retry later.",
+        )
+
+
+# Singleton instance
+admission_controller = AdmissionController()
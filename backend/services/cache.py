@@ -0,0 +1,275 @@
+"""
+Caches shared across requests.
+
+`TTLCache` lives in process memory. `SQLiteCache` stores entries in a local
+SQLite database in WAL mode so every worker process on the host shares hits.
+`create_cache` picks the backend from settings.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+from config import settings
+from logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Values should be plain JSON-compatible data (dicts, lists, strings) rather
+    than model instances so callers never share mutable state.
+    """
+
+    def __init__(self, ttl: int, max_entries: int, stale_ttl: int = 0):
+        """
+        Args:
+            ttl: Default time-to-live for entries, in seconds.
+            max_entries: Maximum entries kept before the least recently used
+                one is evicted.
+            stale_ttl: How long expired entries are kept for stale reads, in
+                seconds.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None if missing or expired.
+
+        With `allow_stale`, entries expired less than `stale_ttl` seconds ago
+        are returned too.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    del self._entries[key]
+                    return None
+                if not allow_stale:
+                    return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (default: the cache TTL)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove `key` from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class SQLiteCache:
+    """
+    Cross-process cache backed by a local SQLite database in WAL mode.
+
+    WAL lets readers proceed concurrently with a writer, so lookups from any
+    worker never wait on another worker's insert. Each namespace is an
+    independent cache inside the shared database file. Values must be
+    JSON-serializable.
+
+    Cache errors are logged and treated as misses - a locked or corrupt cache
+    file must never fail a verification. Lock waits are capped at
+    BUSY_TIMEOUT because every call blocks the thread it runs on, which for
+    the pipeline is the event loop.
+    """
+
+    # Expired and excess entries are pruned once per this many writes
+    PRUNE_EVERY = 500
+
+    # Seconds to wait for another worker's write lock before giving up
+    BUSY_TIMEOUT = 0.1
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        ttl: int,
+        max_entries: int,
+        stale_ttl: int = 0,
+    ):
+        """
+        Args:
+            path: Path of the SQLite database file shared by all workers.
+            namespace: Name separating this cache's entries from others.
+            ttl: Default time-to-live for entries, in seconds.
+            max_entries: Maximum entries kept in this namespace; the entries
+                closest to expiry are evicted first.
+            stale_ttl: How long expired entries are kept for stale reads, in
+                seconds.
+        """
+        self.path = path
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening one after a fork or on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(self.SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None if missing or expired.
+
+        With `allow_stale`, entries expired less than `stale_ttl` seconds ago
+        are returned too.
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._log_error("read", e)
+            return None
+
+        if row is None:
+            return None
+        expires_at = row[1] + self.stale_ttl if allow_stale else row[1]
+        if expires_at <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (default: the cache TTL)."""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), expires_at),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._prune(conn)
+        except sqlite3.Error as e:
+            self._log_error("write", e)
+
+    def delete(self, key: str) -> None:
+        """Remove `key` from the cache if present."""
+        try:
+            self._connection().execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+        except sqlite3.Error as e:
+            self._log_error("delete", e)
+
+    def _log_error(self, action: str, error: sqlite3.Error) -> None:
+        """Log a failed cache call; lock contention is expected under load."""
+        message = str(error)
+        if "locked" in message or "busy" in message:
+            logger.debug("Cache %s skipped, database busy (%s)", action, self.namespace)
+        else:
+            logger.warning("Cache %s failed (%s): %s", action, self.namespace, message)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete entries past their stale window, then the soonest-expiring ones over the limit."""
+        conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, time.time() - self.stale_ttl),
+        )
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key IN ("
+                "SELECT key FROM cache WHERE namespace = ? "
+                "ORDER BY expires_at LIMIT ?)",
+                (self.namespace, self.namespace, excess),
+            )
+
+
+def cache_backend() -> str:
+    """Resolve the configured cache backend ("memory" or "sqlite")."""
+    if settings.cache_backend == "auto":
+        return "sqlite" if settings.workers > 1 else "memory"
+    return settings.cache_backend
+
+
+def create_cache(
+    namespace: str,
+    ttl: int,
+    stale_ttl: int = 0,
+) -> Union[TTLCache, SQLiteCache]:
+    """
+    Create a cache using the configured backend.
+
+    Args:
+        namespace: Name separating this cache's entries in a shared backend.
+        ttl: Default time-to-live for entries, in seconds.
+        stale_ttl: How long expired entries stay available for stale reads.
+    """
+    if cache_backend() == "sqlite":
+        return SQLiteCache(
+            path=settings.cache_path,
+            namespace=namespace,
+            ttl=ttl,
+            max_entries=settings.cache_max_entries,
+            stale_ttl=stale_ttl,
+        )
+    return TTLCache(
+        ttl=ttl,
+        max_entries=settings.cache_max_entries,
+        stale_ttl=stale_ttl,
+    )
+
+
+# Singleton instance for finished verdicts (kept stale for overload fallback)
+verdict_cache = create_cache(
+    "verdicts",
+    settings.verdict_cache_ttl,
+    stale_ttl=settings.stale_verdict_ttl,
+)
+
+# Singleton instance for intermediate pipeline stage outputs
+checkpoint_cache = create_cache("checkpoints", settings.checkpoint_ttl)
+
+# Singleton instances for Researcher results, keyed by query and URL
+search_cache = create_cache("search", settings.search_cache_ttl)
+scrape_cache = create_cache("scrape", settings.scrape_cache_ttl)
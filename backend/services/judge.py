@@ -5,8 +5,12 @@ Compares the article with sources and renders a verdict.
 
 import json
 from datetime import datetime
+from typing import Optional
 from schemas.verify import JudgmentResult
 from clients.gemini import gemini_client
+from logging_config import get_logger, log_payload
+
+logger = get_logger(__name__)
 
 
 class JudgeService:
@@ -39,12 +43,14 @@ Output ONLY the JSON object, no other text."""
         trust_score=50,
         verdict="Unverified",
         reasoning="Unable to complete verification due to processing error.",
+        is_fallback=True,
     )
 
     def judge_article(
         self,
         original_article: str,
         scraped_sources: str,
+        model: Optional[str] = None,
     ) -> JudgmentResult:
         """
         Judge an article by comparing it with scraped sources.
@@ -52,6 +58,7 @@ Output ONLY the JSON object, no other text."""
         Args:
             original_article: The original article text.
             scraped_sources: Combined text from scraped sources.
+            model: Gemini model to judge with (default from settings).
 
         Returns:
             JudgmentResult containing trust_score, verdict, and reasoning.
@@ -63,7 +70,8 @@ Output ONLY the JSON object, no other text."""
         )
 
         try:
-            response_text = gemini_client.generate(prompt)
+            response_text = gemini_client.generate(prompt, model=model)
+            log_payload(logger, "judge.response", response_text)
 
             # Extract JSON from response (handle markdown code blocks)
             json_text = self._extract_json(response_text)
@@ -79,17 +87,18 @@ Output ONLY the JSON object, no other text."""
             )
 
         except json.JSONDecodeError as e:
-            print(f"Error parsing JSON from Gemini: {e}")
+            logger.warning("Error parsing JSON from Gemini: %s", e)
             return self.DEFAULT_RESULT
         except KeyError as e:
-            print(f"Missing required field in Gemini response: {e}")
+            logger.warning("Missing required field in Gemini response: %s", e)
             return self.DEFAULT_RESULT
         except Exception as e:
-            print(f"Error judging article: {e}")
+            logger.exception("Error judging article")
             return JudgmentResult(
                 trust_score=50,
                 verdict="Unverified",
                 reasoning=f"Unable to complete verification: {str(e)}",
+                is_fallback=True,
             )
 
     def _extract_json(self, text: str) -> str:
@@ -2,15 +2,25 @@
 Verification Pipeline - Orchestrates the 3-step fake news detection process.
 """
 
+import asyncio
+from typing import Any, List, Optional
+from clients.gemini import GeminiClient
 from schemas.verify import VerifyResponse
+from logging_config import get_logger
+from usage import record_usage, track_usage, usage_metrics, usage_stage
+from .cache import verdict_cache, checkpoint_cache
+from .preprocessor import article_preprocessor
 from .reader import reader_service
 from .researcher import researcher_service
 from .judge import judge_service
 
+logger = get_logger(__name__)
+
 
 class VerificationPipeline:
     """
     Orchestrates the complete verification pipeline:
+    0. Preprocess: Strip page boilerplate from the article
     1. Reader: Extract core claim
     2. Researcher: Search and scrape sources
     3. Judge: Compare and render verdict
@@ -18,44 +28,223 @@ class VerificationPipeline:
 
     def __init__(self):
         """Initialize the pipeline with service dependencies."""
+        self.preprocessor = article_preprocessor
         self.reader = reader_service
         self.researcher = researcher_service
         self.judge = judge_service
+        self.cache = verdict_cache
+        self.checkpoints = checkpoint_cache
+
+    def lookup(
+        self,
+        content_hash: str,
+        allow_stale: bool = False,
+    ) -> Optional[VerifyResponse]:
+        """
+        Look up a cached verdict without running the pipeline.
+
+        Verdicts are only keyed by content, never by client-supplied URLs, so a
+        client cannot attach a verdict to a page it did not upload.
+
+        Args:
+            content_hash: SHA-256 of the raw article text, lowercased with
+                whitespace collapsed.
+            allow_stale: Also return recently expired verdicts.
 
-    async def verify(self, article_text: str) -> VerifyResponse:
+        Returns:
+            The cached VerifyResponse, or None if the article is unknown.
+        """
+        cached = self.cache.get(f"input:{content_hash}", allow_stale=allow_stale)
+        if cached is None:
+            return None
+        usage_metrics.add_verdict_cache_hit()
+        return VerifyResponse(**cached)
+
+    def lookup_article(
+        self,
+        article_text: str,
+        allow_stale: bool = False,
+    ) -> Optional[VerifyResponse]:
+        """
+        Look up a cached verdict for an uploaded article without preprocessing it.
+
+        Args:
+            article_text: The raw article text.
+            allow_stale: Also return recently expired verdicts.
+
+        Returns:
+            The cached VerifyResponse, or None if the article is unknown.
+        """
+        input_hash = self.preprocessor.hash_text(
+            self.preprocessor.canonicalize(article_text)
+        )
+        return self.lookup(input_hash, allow_stale=allow_stale)
+
+    async def verify(
+        self,
+        article_text: str,
+        judge_model: Optional[str] = None,
+        include_usage: bool = False,
+    ) -> VerifyResponse:
         """
         Execute the full verification pipeline.
 
+        Each stage's output is checkpointed under the article's content hash,
+        so a retry after a failed Judge (or a re-judge with another model)
+        resumes from the last completed stage instead of starting over.
+
         Args:
             article_text: The article text to verify.
+            judge_model: Gemini model for the Judge. When set, the verdict
+                cache is bypassed and only the Judge step is re-run. Internal
+                only - not exposed through the API.
+            include_usage: Attach per-stage token and call usage to the response.
 
         Returns:
             VerifyResponse containing the verification results.
         """
-        # Step 1: Extract core claim and generate search query
-        print("Step 1: Extracting core claim...")
-        search_query = self.reader.extract_core_claim(article_text)
-        print(f"Search query: {search_query}")
-
-        # Step 2: Research the claim
-        print("Step 2: Researching claim...")
-        scraped_sources, sources_count = await self.researcher.research_claim(
-            search_query
+        # Step 0: Strip boilerplate so both prompts get only the article
+        # Large pages take hundreds of ms - keep them off the event loop
+        article = await asyncio.to_thread(self.preprocessor.preprocess, article_text)
+        article_text = article.text
+        logger.info(
+            "Preprocessed article: saved %d bytes",
+            article.bytes_saved,
+            extra={
+                "fields": {
+                    "original_bytes": article.original_bytes,
+                    "cleaned_bytes": article.cleaned_bytes,
+                    "content_hash": article.content_hash,
+                }
+            },
         )
-        print(f"Scraped {len(scraped_sources)} characters from {sources_count} sources")
-
-        # Step 3: Judge the article
-        print("Step 3: Judging article...")
-        judgment = self.judge.judge_article(article_text, scraped_sources)
-
-        # Build and return response
-        return VerifyResponse(
-            trust_score=judgment.trust_score,
-            verdict=judgment.verdict,
-            reasoning=judgment.reasoning,
-            search_query=search_query,
-            sources_checked=sources_count,
+
+        cache_keys = self._cache_keys(article.content_hash, article.input_hash)
+        cached = None if judge_model else self.cache.get(cache_keys[0])
+        if cached is not None:
+            logger.info("Verdict cache hit")
+            usage_metrics.add_verdict_cache_hit()
+            # Refresh the input alias so lookups hit next time
+            self._store(cache_keys, cached)
+            return VerifyResponse(**cached)
+
+        with track_usage() as usage:
+            article_key = article.content_hash
+
+            # Step 1: Extract core claim and generate search query
+            with usage_stage("reader"):
+                search_query = self._load_checkpoint(article_key, "search_query")
+                if search_query is None:
+                    logger.info("Step 1: Extracting core claim")
+                    # Gemini/Serper calls block - run them off the event loop
+                    search_query = await asyncio.to_thread(
+                        self.reader.extract_core_claim, article_text
+                    )
+                    if search_query != GeminiClient.ERROR_RESPONSE:
+                        self._save_checkpoint(article_key, "search_query", search_query)
+            logger.info("Search query: %s", search_query)
+
+            if search_query == GeminiClient.ERROR_RESPONSE:
+                # Nothing to research - fail fast so the retry starts clean
+                logger.warning("Reader failed; skipping research and judgment")
+                scraped_sources, sources_count = "", 0
+                judgment = self.judge.DEFAULT_RESULT
+            else:
+                # Research outputs depend on the query, so key them by it too
+                research_key = f"{article_key}:{self.preprocessor.hash_text(search_query)}"
+
+                # Step 2: Research the claim
+                with usage_stage("researcher"):
+                    scraped = self._load_checkpoint(research_key, "scraped_sources")
+                    if scraped is None:
+                        search_results = self._load_checkpoint(research_key, "search_results")
+                        if search_results is None:
+                            logger.info("Step 2a: Searching for sources")
+                            search_results = await asyncio.to_thread(
+                                self.researcher.search, search_query
+                            )
+                            if search_results:
+                                self._save_checkpoint(
+                                    research_key, "search_results", search_results
+                                )
+
+                        logger.info("Step 2b: Scraping %d sources", len(search_results))
+                        scraped = await self.researcher.scrape_sources(search_results)
+                        if scraped[1]:
+                            self._save_checkpoint(
+                                research_key, "scraped_sources", list(scraped)
+                            )
+                scraped_sources, sources_count = scraped
+                logger.info(
+                    "Scraped %d characters from %d sources",
+                    len(scraped_sources),
+                    sources_count,
+                )
+
+                # Step 3: Judge the article
+                logger.info("Step 3: Judging article")
+                with usage_stage("judge"):
+                    judgment = await asyncio.to_thread(
+                        self.judge.judge_article,
+                        article_text,
+                        scraped_sources,
+                        model=judge_model,
+                    )
+            logger.info(
+                "Verdict: %s (%d)",
+                judgment.verdict,
+                judgment.trust_score,
+            )
+
+            # Build and return response
+            response = VerifyResponse(
+                trust_score=judgment.trust_score,
+                verdict=judgment.verdict,
+                reasoning=judgment.reasoning,
+                search_query=search_query,
+                sources_checked=sources_count,
+            )
+
+        logger.info(
+            "Pipeline usage",
+            extra={"fields": {"usage": {k: v.model_dump() for k, v in usage.stages.items()}}},
         )
+        if include_usage:
+            response.usage = usage.stages
+
+        # Only cache real verdicts so a retry gets another attempt. Re-judges
+        # with a non-default model must not replace the default verdict.
+        if not judgment.is_fallback and not judge_model:
+            self._store(cache_keys, response.model_dump(exclude={"usage"}))
+
+        return response
+
+    def _load_checkpoint(self, article_key: str, stage: str) -> Optional[Any]:
+        """Return a stage's saved output for this article, if still fresh."""
+        value = self.checkpoints.get(f"checkpoint:{article_key}:{stage}")
+        if value is not None:
+            logger.info("Resuming from %s checkpoint", stage)
+            record_usage(cache_hits=1)
+        return value
+
+    def _save_checkpoint(self, article_key: str, stage: str, value: Any) -> None:
+        """Save a completed stage's output for this article."""
+        self.checkpoints.set(f"checkpoint:{article_key}:{stage}", value)
+
+    def _store(self, keys: List[str], value: dict) -> None:
+        """Store a verdict under each of its cache keys."""
+        for key in keys:
+            self.cache.set(key, value)
+
+    @staticmethod
+    def _cache_keys(content_hash: str, input_hash: str) -> List[str]:
+        """
+        Build the verdict cache keys for an article.
+
+        The canonical content hash comes first; the raw input hash is an alias
+        that clients can compute before uploading the article.
+        """
+        return [f"content:{content_hash}", f"input:{input_hash}"]
 
 
 # Singleton instance
@@ -0,0 +1,250 @@
+"""
+Article Preprocessor - runs before the Reader.
+Strips page boilerplate from the extracted article text to shrink LLM input.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import List
+from schemas.verify import PreprocessedArticle
+
+
+class ArticlePreprocessor:
+    """
+    Service for cleaning raw page text before it reaches the LLM prompts.
+
+    Uses cheap line-level heuristics only (no parsing, no model calls):
+    1. Normalize whitespace and split the text into lines
+    2. Cut trailing non-article content (comments, related links)
+    3. Drop lines repeated across the page (share widgets, menus)
+    4. Drop boilerplate lines and navigation menus above or below the article
+
+    Anything that reads like a sentence is kept - losing claim text is worse
+    than sending the LLM a few extra bytes.
+    """
+
+    # Non-prose lines seen this many times or more are page chrome
+    REPEAT_THRESHOLD = 3
+
+    # Only lines this short (in words) can be boilerplate
+    BOILERPLATE_MAX_WORDS = 8
+
+    # A "short" line has at most this many words and no sentence punctuation
+    NAV_MAX_WORDS = 3
+
+    # Consecutive short lines above or below the article treated as a menu
+    NAV_MIN_RUN = 3
+
+    # Trailing markers are only honoured past this fraction of the text
+    TRAILING_MIN_FRACTION = 0.5
+
+    # A trailing section is only cut if at least this fraction of its lines
+    # are short (usernames, "Reply", link titles) - article prose is not
+    TRAILING_MIN_SHORT_FRACTION = 0.5
+    TRAILING_SHORT_LINE_WORDS = 12
+
+    # Below this many characters the cleaned text is considered over-filtered
+    MIN_CLEANED_CHARS = 200
+
+    # Matched at the start of a short line without sentence-ending
+    # punctuation ("Subscribe to our newsletter", "Share on X")
+    BOILERPLATE_PREFIX_PATTERN = re.compile(
+        r"(?:we use cookies|this (site|website) uses cookies|accept( all)? cookies|"
+        r"accept all|cookie (policy|settings|preferences)|privacy policy|"
+        r"terms of (use|service)|subscribe|sign (up|in)|log ?in|"
+        r"share (on|this|via)|follow us|advertisement|sponsored content|"
+        r"all rights reserved|skip to (main )?content)\b",
+        re.IGNORECASE,
+    )
+
+    # Matched against the whole line, punctuation or not
+    BOILERPLATE_LINE_PATTERN = re.compile(
+        r"(?:(?:©|\(c\)|copyright\s*©?)\s*\d{4}.*|"
+        r"all rights reserved|advertisement|sponsored content|"
+        r"accept all( cookies)?|skip to (main )?content|"
+        r"we use cookies\.? accept all( cookies)?)[.!]?",
+        re.IGNORECASE,
+    )
+
+    # Bare section headers only - must match the whole line
+    TRAILING_PATTERN = re.compile(
+        r"(?:(\d+ )?comments?|leave a (comment|reply)|"
+        r"related (articles|stories|posts|content|coverage)|"
+        r"you (may|might) also like|recommended for you|most (read|popular)|"
+        r"about the author|share this (article|story))[\s:]*",
+        re.IGNORECASE,
+    )
+
+    SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+    SENTENCE_END_CHARS = ".!?:;\"'”’)"
+
+    def preprocess(self, article_text: str) -> PreprocessedArticle:
+        """
+        Clean an article and compute its canonical form.
+
+        Args:
+            article_text: The raw text extracted from the page.
+
+        Returns:
+            PreprocessedArticle with the cleaned text, the canonical text used
+            for cache keys, its hash, the hash of the raw input (which clients
+            can compute themselves), and the before/after byte sizes.
+        """
+        lines = self._split_lines(article_text)
+        # Trim first: repeated "Reply"/"Share" lines are what mark a trailer
+        lines = self._trim_trailing(lines)
+        lines = self._drop_repeated(lines)
+        lines = self._drop_boilerplate(lines)
+        text = "\n".join(lines)
+
+        # Heuristics can misfire on unusual pages - never hand the LLM less
+        # than the user actually saw.
+        if len(text) < self.MIN_CLEANED_CHARS:
+            text = " ".join(article_text.split())
+
+        canonical_text = self.canonicalize(text)
+
+        return PreprocessedArticle(
+            text=text,
+            canonical_text=canonical_text,
+            content_hash=self.hash_text(canonical_text),
+            input_hash=self.hash_text(self.canonicalize(article_text)),
+            original_bytes=len(article_text.encode("utf-8")),
+            cleaned_bytes=len(text.encode("utf-8")),
+        )
+
+    @staticmethod
+    def canonicalize(text: str) -> str:
+        """Lowercase and collapse whitespace so trivial differences share a key."""
+        return " ".join(text.split()).lower()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the hex SHA-256 of the given text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _split_lines(self, text: str) -> List[str]:
+        """
+        Split text into whitespace-normalized, non-empty lines.
+
+        Text without line breaks (e.g. already flattened by the client) is split
+        into sentences instead so duplicate filtering still has units to work on.
+        """
+        raw_lines = text.splitlines()
+        if len(raw_lines) <= 1:
+            raw_lines = self.SENTENCE_SPLIT_PATTERN.split(text)
+
+        lines = []
+        for raw in raw_lines:
+            line = " ".join(raw.split())
+            if line:
+                lines.append(line)
+        return lines
+
+    def _drop_repeated(self, lines: List[str]) -> List[str]:
+        """
+        Remove duplicate lines, keeping the first occurrence.
+
+        Non-prose lines repeated REPEAT_THRESHOLD times or more (share
+        buttons, "Reply") are dropped entirely.
+        """
+        keys = [line.lower() for line in lines]
+        counts = Counter(keys)
+        seen = set()
+        kept = []
+        for line, key in zip(lines, keys):
+            if key in seen:
+                continue
+            seen.add(key)
+            if counts[key] >= self.REPEAT_THRESHOLD and not self._is_prose(line):
+                continue
+            kept.append(line)
+        return kept
+
+    def _drop_boilerplate(self, lines: List[str]) -> List[str]:
+        """
+        Remove boilerplate lines, and runs of short lines (menus) that sit
+        above the first or below the last sentence of the article. Short runs
+        inside the article body, such as bulleted lists, are kept.
+        """
+        prose_indexes = [i for i, line in enumerate(lines) if self._is_prose(line)]
+        first_prose = prose_indexes[0] if prose_indexes else len(lines)
+        last_prose = prose_indexes[-1] if prose_indexes else -1
+
+        kept = []
+        nav_run: List[str] = []
+
+        for index, line in enumerate(lines):
+            if self._is_boilerplate(line):
+                continue
+
+            in_margin = index < first_prose or index > last_prose
+            if in_margin and self._is_short(line):
+                nav_run.append(line)
+                continue
+
+            # Anything else ends the run - keep short runs (likely headings)
+            if len(nav_run) < self.NAV_MIN_RUN:
+                kept.extend(nav_run)
+            nav_run = []
+            kept.append(line)
+
+        if len(nav_run) < self.NAV_MIN_RUN:
+            kept.extend(nav_run)
+        return kept
+
+    def _is_boilerplate(self, line: str) -> bool:
+        """Return True if the line is page chrome rather than article text."""
+        if line.count(" ") + 1 > self.BOILERPLATE_MAX_WORDS:
+            return False
+        if self.BOILERPLATE_LINE_PATTERN.fullmatch(line):
+            return True
+        # Sentences that merely start with a listed phrase are article text
+        return (
+            line[-1] not in self.SENTENCE_END_CHARS
+            and self.BOILERPLATE_PREFIX_PATTERN.match(line) is not None
+        )
+
+    def _is_short(self, line: str) -> bool:
+        """Return True for menu-item-like lines: few words, no sentence punctuation."""
+        return line.count(" ") + 1 <= self.NAV_MAX_WORDS and line[-1] not in self.SENTENCE_END_CHARS
+
+    def _is_prose(self, line: str) -> bool:
+        """Return True for lines that read like a sentence."""
+        return line.count(" ") + 1 > self.NAV_MAX_WORDS and line[-1] in self.SENTENCE_END_CHARS
+
+    def _trim_trailing(self, lines: List[str]) -> List[str]:
+        """
+        Cut everything from the first trailing-section header onwards.
+
+        The cut only happens when the lines after the header look like
+        comments or link lists rather than more article text.
+        """
+        total_chars = sum(len(line) for line in lines)
+        min_chars = total_chars * self.TRAILING_MIN_FRACTION
+
+        seen_chars = 0
+        for index, line in enumerate(lines):
+            if (
+                seen_chars >= min_chars
+                and self.TRAILING_PATTERN.fullmatch(line)
+                and self._looks_like_trailer(lines[index + 1:])
+            ):
+                return lines[:index]
+            seen_chars += len(line)
+        return lines
+
+    def _looks_like_trailer(self, tail: List[str]) -> bool:
+        """Return True if most lines in `tail` are short."""
+        if not tail:
+            return True
+        short = sum(
+            1 for line in tail if line.count(" ") + 1 <= self.TRAILING_SHORT_LINE_WORDS
+        )
+        return short >= len(tail) * self.TRAILING_MIN_SHORT_FRACTION
+
+
+# Singleton instance
+article_preprocessor = ArticlePreprocessor()
@@ -4,6 +4,9 @@ Extracts the core claim from an article and generates a search query.
 """
 
 from clients.gemini import gemini_client
+from logging_config import get_logger, log_payload
+
+logger = get_logger(__name__)
 
 
 class ReaderService:
@@ -38,12 +41,11 @@ class ReaderService:
             Exception: If Gemini fails to generate a response.
         """
         prompt = self.PROMPT_TEMPLATE.format(article_text=article_text)
-        print(f"🔍 DEBUG: Generating prompt: {prompt}")
+        log_payload(logger, "reader.prompt", prompt)
         response = gemini_client.generate(prompt)
-        print(f"🔍 DEBUG: Gemini response: {response}")
+        log_payload(logger, "reader.response", response)
         # Clean up the response - remove quotes and extra whitespace
         search_query = response.replace('"', "").replace("'", "").strip()
-        print(f"🔍 DEBUG: Cleaned search query: {search_query}")
 
         return search_query
 
@@ -8,6 +8,8 @@ from typing import List, Tuple
 from clients.serper import serper_client
 from clients.yellowcake import yellowcake_client
 from config import settings
+from usage import record_usage
+from .cache import search_cache, scrape_cache
 
 
 class ResearcherService:
@@ -25,9 +27,41 @@ class ResearcherService:
         Returns:
             Tuple of (combined scraped content, number of sources checked).
         """
+        search_results = self.search(search_query)
+        return await self.scrape_sources(search_results)
+
+    def search(self, search_query: str) -> List[dict]:
+        """
+        Search Google for sources on a claim, using cached results when available.
+
+        Args:
+            search_query: The search query to use.
+
+        Returns:
+            List of dicts containing link, title, snippet, and date for each result.
+        """
+        cache_key = " ".join(search_query.lower().split())
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            record_usage(cache_hits=1)
+            return cached
+
         # Get rich context from Google search
-        search_results = serper_client.search(search_query)
+        results = serper_client.search(search_query)
+        if results:
+            search_cache.set(cache_key, results)
+        return results
 
+    async def scrape_sources(self, search_results: List[dict]) -> Tuple[str, int]:
+        """
+        Scrape the given search results in parallel.
+
+        Args:
+            search_results: Results from `search`.
+
+        Returns:
+            Tuple of (combined scraped content, number of sources checked).
+        """
         if not search_results:
             return "No sources found for verification.", 0
 
@@ -39,12 +73,18 @@ class ResearcherService:
             date = result["date"]
 
             try:
+                truncated_content = scrape_cache.get(link)
+                if truncated_content is not None:
+                    record_usage(cache_hits=1)
+                    return f"Source: {link}\n{truncated_content}"
+
                 # Run scrape in a separate thread to avoid blocking
                 content = await asyncio.to_thread(yellowcake_client.scrape, link)
 
                 if content:
-                    # Scrape succeeded - truncate and return
+                    # Scrape succeeded - truncate, cache and return
                     truncated_content = content[: settings.max_content_per_source]
+                    scrape_cache.set(link, truncated_content)
                     return f"Source: {link}\n{truncated_content}"
                 else:
                     # Scrape returned empty - use snippet fallback
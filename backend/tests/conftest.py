@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Run from anywhere: make the backend modules importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing services builds the API client singletons; tests never call out
+os.environ.setdefault("GEMINI_API_KEY", "test")
@@ -0,0 +1,161 @@
+"""
+Tests for admission control on the verification pipeline.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from config import settings
+from schemas.verify import JudgmentResult
+from services import admission
+from services.admission import AdmissionController, AdmissionRejected, TokenBucket
+from services.cache import TTLCache
+from services.pipeline import verification_pipeline
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(admission, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    """Small limits so tests can fill the queue quickly."""
+    monkeypatch.setattr(settings, "rate_limit_per_minute", 60)
+    monkeypatch.setattr(settings, "rate_limit_burst", 2)
+    monkeypatch.setattr(settings, "max_inflight_pipelines", 1)
+    monkeypatch.setattr(settings, "max_queued_pipelines", 1)
+    monkeypatch.setattr(settings, "queue_wait_timeout", 0.2)
+    monkeypatch.setattr(settings, "overload_retry_after", 7)
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(rate=0.5, capacity=2)
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    # Empty: the next token arrives in 1 / rate seconds
+    assert bucket.take() == pytest.approx(2.0)
+
+    clock.now += 1.0
+    assert bucket.take() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert bucket.take() == 0
+
+
+def test_token_bucket_caps_at_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    clock.now += 60
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() > 0
+
+
+def test_check_rate_sets_retry_after(clock, limits):
+    controller = AdmissionController()
+    controller.check_rate("client")
+    controller.check_rate("client")
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.check_rate("client")
+    assert rejected.value.status_code == 429
+    assert rejected.value.retry_after == 1
+
+    # Other clients have their own bucket
+    controller.check_rate("other")
+
+
+def test_check_rate_evicts_least_recent_client(clock, limits, monkeypatch):
+    monkeypatch.setattr(AdmissionController, "MAX_TRACKED_CLIENTS", 2)
+    controller = AdmissionController()
+    controller.check_rate("a")
+    controller.check_rate("b")
+    controller.check_rate("a")
+    controller.check_rate("c")
+    assert list(controller._buckets) == ["a", "c"]
+
+
+def test_slot_rejects_when_queue_full(limits):
+    async def scenario():
+        controller = AdmissionController()
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+
+        # One running, one queued: the next request is rejected immediately
+        started = time.perf_counter()
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with controller.slot():
+                pass
+        assert time.perf_counter() - started < 0.05
+        assert rejected.value.status_code == 503
+        assert rejected.value.retry_after == 7
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+    asyncio.run(scenario())
+
+
+def test_queued_request_rejected_within_timeout_while_pipeline_blocks(
+    limits, monkeypatch
+):
+    """Slow Gemini calls must not stop the event loop from shedding load."""
+    pipeline = verification_pipeline
+    monkeypatch.setattr(pipeline, "cache", TTLCache(ttl=60, max_entries=10))
+    monkeypatch.setattr(pipeline, "checkpoints", TTLCache(ttl=60, max_entries=10))
+
+    def slow_reader(article_text):
+        time.sleep(1.0)
+        return "query"
+
+    async def no_scrape(search_results):
+        return "sources", 1
+
+    monkeypatch.setattr(pipeline.reader, "extract_core_claim", slow_reader)
+    monkeypatch.setattr(pipeline.researcher, "search", lambda query: [])
+    monkeypatch.setattr(pipeline.researcher, "scrape_sources", no_scrape)
+    monkeypatch.setattr(
+        pipeline.judge,
+        "judge_article",
+        lambda article, sources, model=None: JudgmentResult(
+            trust_score=80, verdict="True", reasoning="ok"
+        ),
+    )
+
+    async def scenario():
+        controller = AdmissionController()
+
+        async def run():
+            async with controller.slot():
+                return await pipeline.verify("A slow article body. " * 20)
+
+        running = asyncio.create_task(run())
+        await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        with pytest.raises(AdmissionRejected):
+            async with controller.slot():
+                pass
+        assert time.perf_counter() - started < 0.5
+
+        await running
+
+    asyncio.run(scenario())
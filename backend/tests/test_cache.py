@@ -0,0 +1,125 @@
+"""
+Tests for the in-memory and SQLite caches.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from services import cache
+from services.cache import SQLiteCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache.sqlite3")
+
+
+def test_ttl_cache_expires_entries(clock):
+    store = TTLCache(ttl=10, max_entries=10)
+    store.set("a", {"v": 1})
+    clock.now += 9
+    assert store.get("a") == {"v": 1}
+    clock.now += 1
+    assert store.get("a") is None
+
+
+def test_ttl_cache_serves_stale_within_window(clock):
+    store = TTLCache(ttl=10, max_entries=10, stale_ttl=5)
+    store.set("a", "value")
+    clock.now += 12
+    assert store.get("a") is None
+    assert store.get("a", allow_stale=True) == "value"
+    clock.now += 3
+    assert store.get("a", allow_stale=True) is None
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    store = TTLCache(ttl=10, max_entries=2)
+    store.set("a", 1)
+    store.set("b", 2)
+    store.get("a")
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+def test_sqlite_cache_expires_entries(clock, db_path):
+    store = SQLiteCache(db_path, "test", ttl=10, max_entries=10)
+    store.set("a", {"v": [1, 2]})
+    assert store.get("a") == {"v": [1, 2]}
+    clock.now += 10
+    assert store.get("a") is None
+
+
+def test_sqlite_cache_serves_stale_within_window(clock, db_path):
+    store = SQLiteCache(db_path, "test", ttl=10, max_entries=10, stale_ttl=5)
+    store.set("a", "value")
+    clock.now += 12
+    assert store.get("a") is None
+    assert store.get("a", allow_stale=True) == "value"
+    clock.now += 3
+    assert store.get("a", allow_stale=True) is None
+
+
+def test_sqlite_cache_shares_entries_across_instances(db_path):
+    writer = SQLiteCache(db_path, "verdicts", ttl=60, max_entries=10)
+    reader = SQLiteCache(db_path, "verdicts", ttl=60, max_entries=10)
+    other = SQLiteCache(db_path, "search", ttl=60, max_entries=10)
+    writer.set("a", "value")
+    assert reader.get("a") == "value"
+    assert other.get("a") is None
+
+
+def test_sqlite_cache_prune_drops_expired_then_soonest_expiring(clock, db_path, monkeypatch):
+    monkeypatch.setattr(SQLiteCache, "PRUNE_EVERY", 4)
+    store = SQLiteCache(db_path, "test", ttl=10, max_entries=2, stale_ttl=5)
+    store.set("expired", 1, ttl=1)
+    store.set("stale", 2, ttl=8)
+    store.set("later", 3, ttl=30)
+    clock.now += 9
+    # Fourth write triggers a prune: "expired" is past its stale window,
+    # then "stale" is the soonest to expire of the three left
+    store.set("latest", 4, ttl=60)
+
+    conn = sqlite3.connect(db_path)
+    keys = {row[0] for row in conn.execute("SELECT key FROM cache")}
+    conn.close()
+    assert keys == {"later", "latest"}
+
+
+def test_sqlite_cache_treats_locked_database_as_miss(db_path):
+    store = SQLiteCache(db_path, "test", ttl=60, max_entries=10)
+    store.set("a", "value")
+
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    blocker.execute("BEGIN EXCLUSIVE")
+    try:
+        # Writes give up after BUSY_TIMEOUT instead of blocking the caller
+        started = time.perf_counter()
+        store.set("b", "value")
+        assert time.perf_counter() - started < 1.0
+    finally:
+        blocker.execute("ROLLBACK")
+        blocker.close()
+    assert store.get("b") is None
@@ -0,0 +1,43 @@
+"""
+Tests for the queued JSON logging setup.
+"""
+
+import json
+import logging
+import queue
+
+from logging_config import JsonFormatter, StructuredQueueHandler
+
+
+def _log_through_queue(**kwargs) -> dict:
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger = logging.getLogger("tests.logging_config")
+    logger.propagate = False
+    handler = StructuredQueueHandler(log_queue)
+    logger.addHandler(handler)
+    try:
+        logger.error("Stage %s failed", "reader", **kwargs)
+    finally:
+        logger.removeHandler(handler)
+    return json.loads(JsonFormatter().format(log_queue.get_nowait()))
+
+
+def test_exception_kept_out_of_message():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        entry = _log_through_queue(exc_info=True)
+
+    assert entry["message"] == "Stage reader failed"
+    assert "Traceback" in entry["exc_info"]
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_fields_cannot_overwrite_reserved_keys():
+    entry = _log_through_queue(
+        extra={"fields": {"message": "spoofed", "level": "DEBUG", "bytes": 10}}
+    )
+
+    assert entry["message"] == "Stage reader failed"
+    assert entry["level"] == "ERROR"
+    assert entry["fields"] == {"message": "spoofed", "level": "DEBUG", "bytes": 10}
@@ -0,0 +1,90 @@
+"""
+Regression tests for the article preprocessor heuristics.
+"""
+
+from services.preprocessor import ArticlePreprocessor
+
+NEWS_SENTENCES = [
+    "The bill, sponsored by Senator Jane Smith, would raise taxes on large firms.",
+    "Apple said its market share on the exchange fell for a third quarter.",
+    "Analysts warned that the newsletter industry is consolidating quickly.",
+    "Shares of the cookie maker rose after the announcement on Tuesday.",
+    "Officials said the measure would take effect next month.",
+    "Critics argued the policy had not been reviewed by independent experts.",
+]
+
+
+def test_keeps_news_sentences_in_flattened_text():
+    text = " ".join(NEWS_SENTENCES)
+    result = ArticlePreprocessor().preprocess(text)
+    for sentence in NEWS_SENTENCES:
+        assert sentence in result.text
+
+
+def test_keeps_news_sentences_as_lines():
+    text = "\n".join(NEWS_SENTENCES)
+    result = ArticlePreprocessor().preprocess(text)
+    assert result.text.splitlines() == NEWS_SENTENCES
+
+
+def test_drops_chrome_lines():
+    text = "\n".join(
+        ["We use cookies. Accept all", "Subscribe to our newsletter"]
+        + NEWS_SENTENCES
+        + ["Share on Facebook", "All rights reserved."]
+    )
+    result = ArticlePreprocessor().preprocess(text)
+    assert result.text.splitlines() == NEWS_SENTENCES
+
+
+def test_subheading_does_not_cut_article():
+    tail = [
+        "More from the interview:",
+        "The minister said the funding would be spread across five regions.",
+        "She added that a full audit would be published before the summer.",
+    ]
+    result = ArticlePreprocessor().preprocess("\n".join(NEWS_SENTENCES + tail))
+    assert result.text.splitlines() == NEWS_SENTENCES + tail
+
+
+def test_cuts_comment_section():
+    comments = ["Comments", "user12", "This is fake news.", "Reply", "user99", "Agreed.", "Reply"]
+    result = ArticlePreprocessor().preprocess("\n".join(NEWS_SENTENCES + comments))
+    assert result.text.splitlines() == NEWS_SENTENCES
+
+
+def test_keeps_sentences_starting_with_boilerplate_phrases():
+    sentences = [
+        "Copyright law was changed by parliament last year.",
+        "Privacy policy changes drew sharp criticism.",
+        "Login attempts rose 40 percent in March.",
+    ]
+    text = "\n".join(NEWS_SENTENCES + sentences)
+    result = ArticlePreprocessor().preprocess(text)
+    assert result.text.splitlines() == NEWS_SENTENCES + sentences
+
+
+def test_drops_copyright_footer():
+    footer = ["© 2024 Example News", "(c) 2023 Example News. All rights reserved."]
+    result = ArticlePreprocessor().preprocess("\n".join(NEWS_SENTENCES + footer))
+    assert result.text.splitlines() == NEWS_SENTENCES
+
+
+def test_keeps_bulleted_list_in_article_body():
+    provinces = ["Ontario", "Quebec", "British Columbia", "Alberta"]
+    lines = NEWS_SENTENCES[:3] + provinces + NEWS_SENTENCES[3:]
+    result = ArticlePreprocessor().preprocess("\n".join(lines))
+    assert result.text.splitlines() == lines
+
+
+def test_drops_menu_above_article():
+    menu = ["Home", "World", "Politics", "Business"]
+    result = ArticlePreprocessor().preprocess("\n".join(menu + NEWS_SENTENCES))
+    assert result.text.splitlines() == NEWS_SENTENCES
+
+
+def test_keeps_first_copy_of_repeated_prose():
+    quote = "“We will not back down,” the minister said."
+    lines = [quote] + NEWS_SENTENCES[:3] + [quote] + NEWS_SENTENCES[3:] + [quote]
+    result = ArticlePreprocessor().preprocess("\n".join(lines))
+    assert result.text.splitlines() == [quote] + NEWS_SENTENCES
@@ -0,0 +1,108 @@
+"""
+Token and external call accounting per pipeline stage.
+
+The pipeline opens a `track_usage()` block per request and marks each stage
+with `usage_stage()`. Clients call `record_usage()` after every billable call;
+the counts land on the current request's current stage via context variables,
+which follow the request into `asyncio.to_thread` workers and gathered tasks.
+Finished requests are folded into the process-wide `usage_metrics`.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from schemas.verify import StageUsage
+
+
+class RequestUsage:
+    """Usage counters for a single request, grouped by stage."""
+
+    def __init__(self):
+        self.stages: Dict[str, StageUsage] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, **counts: int) -> None:
+        """Add counts to a stage (scrapes run in parallel threads, hence the lock)."""
+        with self._lock:
+            usage = self.stages.setdefault(stage, StageUsage())
+            for field, value in counts.items():
+                setattr(usage, field, getattr(usage, field) + value)
+
+
+class UsageMetrics:
+    """Process-wide usage totals across all requests."""
+
+    def __init__(self):
+        self.pipeline_runs = 0
+        self.verdict_cache_hits = 0
+        self.stages: Dict[str, StageUsage] = {}
+        self._lock = threading.Lock()
+
+    def add_request(self, request_usage: RequestUsage) -> None:
+        """Fold a finished request's usage into the totals."""
+        with self._lock:
+            self.pipeline_runs += 1
+            for stage, usage in request_usage.stages.items():
+                totals = self.stages.setdefault(stage, StageUsage())
+                for field, value in usage:
+                    setattr(totals, field, getattr(totals, field) + value)
+
+    def add_verdict_cache_hit(self) -> None:
+        """Count a verdict served from cache without running the pipeline."""
+        with self._lock:
+            self.verdict_cache_hits += 1
+
+    def snapshot(self) -> dict:
+        """Return the current totals as plain data."""
+        with self._lock:
+            return {
+                "pipeline_runs": self.pipeline_runs,
+                "verdict_cache_hits": self.verdict_cache_hits,
+                "stages": {name: usage.model_dump() for name, usage in self.stages.items()},
+            }
+
+
+_request_usage: ContextVar[Optional[RequestUsage]] = ContextVar("request_usage", default=None)
+_stage: ContextVar[str] = ContextVar("usage_stage", default="other")
+
+
+@contextmanager
+def track_usage() -> Iterator[RequestUsage]:
+    """Collect usage for the enclosed pipeline run and add it to the totals."""
+    request_usage = RequestUsage()
+    token = _request_usage.set(request_usage)
+    try:
+        yield request_usage
+    finally:
+        _request_usage.reset(token)
+        usage_metrics.add_request(request_usage)
+
+
+@contextmanager
+def usage_stage(name: str) -> Iterator[None]:
+    """Attribute usage recorded in the enclosed block to the named stage."""
+    token = _stage.set(name)
+    try:
+        yield
+    finally:
+        _stage.reset(token)
+
+
+def record_usage(**counts: int) -> None:
+    """
+    Record usage against the current request's current stage.
+
+    Does nothing outside a `track_usage()` block.
+
+    Args:
+        **counts: Increments for `StageUsage` fields, e.g. `gemini_calls=1`.
+    """
+    request_usage = _request_usage.get()
+    if request_usage is not None:
+        request_usage.add(_stage.get(), **counts)
+
+
+# Singleton instance
+usage_metrics = UsageMetrics()
@@ -36,6 +36,16 @@ async function verifyArticle() {
       return;
     }
 
+    summaryElement.textContent = 'Checking for a known verdict...';
+
+    // Ask for a cached verdict first so known articles are never uploaded
+    const contentHash = await hashArticleText(articleText);
+    const cached = await lookupVerdict(contentHash);
+    if (cached) {
+      displayResult(cached, summaryElement);
+      return;
+    }
+
     summaryElement.textContent = 'Verifying article...';
 
     // Send to backend
@@ -63,6 +73,32 @@ async function verifyArticle() {
   }
 }
 
+// SHA-256 of the article text, lowercased with whitespace collapsed
+// (must match the backend's ArticlePreprocessor.canonicalize)
+async function hashArticleText(text) {
+  const canonical = text.trim().split(/\s+/).join(' ').toLowerCase();
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(canonical));
+  return Array.from(new Uint8Array(digest))
+    .map(b => b.toString(16).padStart(2, '0'))
+    .join('');
+}
+
+// Returns the cached verdict for this article, or null on a miss or error
+async function lookupVerdict(contentHash) {
+  try {
+    const params = new URLSearchParams({ content_hash: contentHash });
+    const response = await fetch(`${BACKEND_URL}/verify/lookup?${params}`);
+    if (!response.ok) {
+      return null;
+    }
+    const lookup = await response.json();
+    return lookup.status === 'hit' ? lookup.result : null;
+  } catch (error) {
+    console.warn('Verdict lookup failed:', error);
+    return null;
+  }
+}
+
 // Function to be injected into the page to extract article text
 function extractArticleText() {
   // Try to find article content in order of priority
@@ -98,8 +134,12 @@ function extractArticleText() {
   // Get text content
   let text = clone.innerText || clone.textContent || '';
   
-  // Clean up whitespace
-  text = text.replace(/\s+/g, ' ').trim();
+  // Clean up whitespace, keeping line breaks so the server can filter
+  // boilerplate (menus, share widgets, comments) line by line
+  text = text
+    .replace(/[^\S\n]+/g, ' ')
+    .replace(/ *\n\s*/g, '\n')
+    .trim();
 
   return text;
 }